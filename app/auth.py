@@ -7,9 +7,8 @@ import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt import ExpiredSignatureError, InvalidTokenError
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from . import models
+from . import models, queries
 from .db import get_session
 from .entities import User
 
@@ -30,8 +29,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 
 async def get_user_by_login(session: AsyncSession, login: str) -> Optional[User]:
-    stmt = select(User).where(User.login == login)
-    result = await session.execute(stmt)
+    result = await session.execute(queries.USER_BY_LOGIN, {"login": login})
     return result.scalar_one_or_none()
 
 
@@ -0,0 +1,70 @@
+"""Сборка мини-фронта: python -m app.build_static
+
+Выносит встроенные стили и скрипт index.html в файлы assets/ с хэшем
+содержимого в имени и кладет рядом сжатые .gz/.br копии.
+"""
+import gzip
+import hashlib
+import re
+import shutil
+from pathlib import Path
+import brotli
+from .compression import ASSETS_DIR, FILE_SUFFIXES
+
+SOURCE_DIR = Path(__file__).resolve().parent / "static"
+DIST_DIR = Path(__file__).resolve().parent / "static_dist"
+MIN_COMPRESS_SIZE = 256
+COMPRESSIBLE_SUFFIXES = {".html", ".css", ".js", ".json", ".svg", ".txt"}
+
+STYLE_RE = re.compile(r"<style>(.*?)</style>", re.S)
+SCRIPT_RE = re.compile(r"<script>(.*?)</script>", re.S)
+
+
+def _write_asset(dist: Path, content: str, suffix: str) -> str:
+    data = content.strip().encode("utf-8") + b"\n"
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    name = f"app.{digest}{suffix}"
+    (dist / ASSETS_DIR / name).write_bytes(data)
+    return f"{ASSETS_DIR}/{name}"
+
+
+def _precompress(path: Path) -> None:
+    data = path.read_bytes()
+    if path.suffix not in COMPRESSIBLE_SUFFIXES or len(data) < MIN_COMPRESS_SIZE:
+        return
+    variants = {
+        "gzip": gzip.compress(data, compresslevel=9, mtime=0),
+        "br": brotli.compress(data, quality=11),
+    }
+    for encoding, compressed in variants.items():
+        if len(compressed) < len(data):
+            path.with_name(path.name + FILE_SUFFIXES[encoding]).write_bytes(compressed)
+
+
+def build(source: Path = SOURCE_DIR, dist: Path = DIST_DIR) -> None:
+    shutil.rmtree(dist, ignore_errors=True)
+    shutil.copytree(source, dist)
+    (dist / ASSETS_DIR).mkdir(exist_ok=True)
+
+    index = dist / "index.html"
+    html = index.read_text(encoding="utf-8")
+    html = STYLE_RE.sub(
+        lambda m: f'<link rel="stylesheet" href="{_write_asset(dist, m.group(1), ".css")}" />',
+        html,
+    )
+    html = SCRIPT_RE.sub(
+        lambda m: f'<script src="{_write_asset(dist, m.group(1), ".js")}"></script>',
+        html,
+    )
+    index.write_text(html, encoding="utf-8")
+
+    for path in sorted(dist.rglob("*")):
+        if path.is_file():
+            _precompress(path)
+
+
+if __name__ == "__main__":
+    build()
+    for path in sorted(DIST_DIR.rglob("*")):
+        if path.is_file():
+            print(f"{path.stat().st_size:>8}  {path.relative_to(DIST_DIR)}")
@@ -0,0 +1,235 @@
+import mimetypes
+import os
+import zlib
+from typing import Optional
+import brotli
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Порядок важен: при равном q-факторе клиенту отдается первый вариант.
+SUPPORTED_ENCODINGS = ("br", "gzip")
+FILE_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+ASSETS_DIR = "assets"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+COMPRESSIBLE_CONTENT_TYPES = {
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+}
+
+
+def accepted_encodings(accept_encoding: str) -> list[str]:
+    """Поддерживаемые кодировки из Accept-Encoding по убыванию q-фактора."""
+    weights = {}
+    for item in accept_encoding.split(","):
+        name, *params = item.split(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = min(max(float(value.strip()), 0.0), 1.0)
+                except ValueError:
+                    quality = 0.0
+        weights[name] = quality
+    qualities = {
+        encoding: weights.get(encoding, weights.get("*", 0.0))
+        for encoding in SUPPORTED_ENCODINGS
+    }
+    return sorted(
+        (encoding for encoding, quality in qualities.items() if quality > 0),
+        key=lambda encoding: -qualities[encoding],
+    )
+
+
+def is_compressible(content_type: str) -> bool:
+    """Сжимаем только текст; архивы, картинки и прочий бинарь уже плотные."""
+    media_type = content_type.partition(";")[0].strip().lower()
+    if media_type == "text/event-stream":
+        return False
+    return (
+        media_type.startswith("text/")
+        or media_type in COMPRESSIBLE_CONTENT_TYPES
+        or media_type.endswith(("+json", "+xml"))
+    )
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    encodings = accepted_encodings(accept_encoding)
+    return encodings[0] if encodings else None
+
+
+class GzipStream:
+    def __init__(self, level: int = 6) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliStream:
+    def __init__(self, quality: int = 4) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def make_stream(encoding: str, gzip_level: int = 6, brotli_quality: int = 4):
+    if encoding == "br":
+        return BrotliStream(brotli_quality)
+    return GzipStream(gzip_level)
+
+
+class CompressionMiddleware:
+    """Сжимает ответы gzip или brotli по Accept-Encoding.
+
+    Сжимаются только текстовые типы (см. is_compressible). Ответы меньше
+    minimum_size, уже сжатые и частичные (206) уходят как есть.
+    Потоковые ответы сжимаются по чанкам, без буферизации всего тела.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # У HEAD пустое тело: сжатую длину не узнать, поэтому заголовки
+        # всегда отдаются как для несжатого ответа.
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream = send
+        self.initial_message: Message = {}
+        self.passthrough = False
+        self.started = False
+        self.stream = None
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self.initial_message = message
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] in (204, 206, 304)
+                or not is_compressible(content_type)
+            )
+            if self.passthrough:
+                await self.downstream(message)
+            return
+        if self.passthrough or message_type != "http.response.body":
+            if not self.started and not self.passthrough:
+                self.started = True
+                await self.downstream(self.initial_message)
+            await self.downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not self.started:
+            self.started = True
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            if "accept-encoding" not in headers.get("vary", "").lower():
+                headers.add_vary_header("Accept-Encoding")
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+                await self.downstream(self.initial_message)
+                await self.downstream(message)
+                return
+            self.stream = make_stream(
+                self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality
+            )
+            headers["Content-Encoding"] = self.encoding
+            if "etag" in headers and not headers["etag"].startswith("W/"):
+                headers["ETag"] = "W/" + headers["etag"]
+            if more_body:
+                del headers["Content-Length"]
+                message["body"] = self.stream.compress(body)
+            else:
+                message["body"] = self.stream.compress(body) + self.stream.finish()
+                headers["Content-Length"] = str(len(message["body"]))
+            await self.downstream(self.initial_message)
+            await self.downstream(message)
+            return
+
+        if more_body:
+            message["body"] = self.stream.compress(body)
+        else:
+            message["body"] = self.stream.compress(body) + self.stream.finish()
+        await self.downstream(message)
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles, отдающий заранее сжатые .br/.gz рядом с исходным файлом.
+
+    Файлы с хэшем содержимого в имени (каталог assets/) кэшируются навсегда,
+    остальные (index.html) каждый раз перепроверяются по ETag.
+    """
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        full_path = os.fspath(full_path)
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        encoding = next(
+            (
+                encoding
+                for encoding in accepted_encodings(accept_encoding)
+                if os.path.isfile(full_path + FILE_SUFFIXES[encoding])
+            ),
+            None,
+        )
+        if encoding:
+            variant_path = full_path + FILE_SUFFIXES[encoding]
+            response = super().file_response(
+                variant_path, os.stat(variant_path), scope, status_code
+            )
+            if response.status_code != 304:
+                media_type, _ = mimetypes.guess_type(full_path)
+                media_type = media_type or "application/octet-stream"
+                if media_type.startswith("text/"):
+                    media_type += "; charset=utf-8"
+                response.headers["Content-Type"] = media_type
+                response.headers["Content-Encoding"] = encoding
+        else:
+            response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers.setdefault("Vary", "Accept-Encoding")
+        relative = os.path.relpath(full_path, os.path.realpath(self.directory))
+        if relative.split(os.sep)[0] == ASSETS_DIR:
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        else:
+            response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+        return response
+
@@ -1,17 +1,71 @@
 import os
+from collections import Counter
 from typing import AsyncGenerator
+from sqlalchemy import Column, Integer, Table, delete, event, insert, inspect, select
+from sqlalchemy.engine.interfaces import CacheStats
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./app.db")
 
+# Увеличивать при каждом изменении моделей в entities.py.
+SCHEMA_VERSION = 1
+
 engine = create_async_engine(DATABASE_URL, echo=False, future=True)
 AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
 Base = declarative_base()
 
+schema_version = Table(
+    "schema_version",
+    Base.metadata,
+    Column("version", Integer, nullable=False),
+)
+
+_cache_stats: Counter = Counter()
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _count_compiled_cache(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        _cache_stats[context.cache_hit] += 1
+
+
+def get_cache_stats() -> dict:
+    hits = _cache_stats[CacheStats.CACHE_HIT]
+    misses = _cache_stats[CacheStats.CACHE_MISS]
+    # _compiled_cache — приватный атрибут Engine (LRUCache), в другой версии
+    # SQLAlchemy его может не оказаться; тогда размер и емкость равны 0.
+    compiled_cache = getattr(engine.sync_engine, "_compiled_cache", None)
+    return {
+        "hits": hits,
+        "misses": misses,
+        "uncached": sum(_cache_stats.values()) - hits - misses,
+        "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+        "size": len(compiled_cache) if compiled_cache is not None else 0,
+        "capacity": getattr(compiled_cache, "capacity", 0),
+    }
+
+
+async def ensure_schema() -> bool:
+    """Создает таблицы, только если версия схемы в базе устарела.
+
+    Возвращает True, если create_all действительно выполнялся.
+    """
+    async with engine.connect() as conn:
+        has_table = await conn.run_sync(
+            lambda sync_conn: inspect(sync_conn).has_table(schema_version.name)
+        )
+        current = await conn.scalar(select(schema_version.c.version)) if has_table else None
+    if current == SCHEMA_VERSION:
+        return False
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(delete(schema_version))
+        await conn.execute(insert(schema_version).values(version=SCHEMA_VERSION))
+    return True
+
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         yield session
-
@@ -1,21 +1,45 @@
+import time
+
+# Таймер стартует до тяжелых импортов (fastapi, sqlalchemy), чтобы
+# import_seconds в /stats учитывал их стоимость.
+_PROCESS_STARTED = time.perf_counter()
+
+import logging
 from pathlib import Path
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
-from .db import Base, engine
-from .routers import auth_routes, categories_routes, transactions_routes
+from .compression import CompressionMiddleware, PrecompressedStaticFiles
+from .db import ensure_schema
+from .routers import auth_routes, categories_routes, stats_routes, transactions_routes
+
+_IMPORTS_FINISHED = time.perf_counter()
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="Finance Tracker API",
     description="Учет личных доходов и расходов по категориям",
 )
+app.add_middleware(CompressionMiddleware, minimum_size=1024)
 STATIC_DIR = Path(__file__).resolve().parent / "static"
+STATIC_DIST_DIR = Path(__file__).resolve().parent / "static_dist"
 
 
 @app.on_event("startup")
 async def on_startup() -> None:
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    schema_started = time.perf_counter()
+    app.state.schema_created = await ensure_schema()
+    finished = time.perf_counter()
+    app.state.import_seconds = round(_IMPORTS_FINISHED - _PROCESS_STARTED, 4)
+    app.state.schema_seconds = round(finished - schema_started, 4)
+    app.state.startup_seconds = round(finished - _PROCESS_STARTED, 4)
+    logger.info(
+        "Startup finished in %.3fs (imports %.3fs, schema check %.3fs, schema created: %s)",
+        app.state.startup_seconds,
+        app.state.import_seconds,
+        app.state.schema_seconds,
+        app.state.schema_created,
+    )
 
 
 @app.exception_handler(404)
@@ -29,8 +53,15 @@ async def not_found_handler(request: Request, exc):
 app.include_router(auth_routes.router)
 app.include_router(categories_routes.router)
 app.include_router(transactions_routes.router)
+app.include_router(stats_routes.router)
 
-if STATIC_DIR.exists():
+if STATIC_DIST_DIR.exists():
+    app.mount(
+        "/ui",
+        PrecompressedStaticFiles(directory=STATIC_DIST_DIR, html=True),
+        name="ui",
+    )
+elif STATIC_DIR.exists():
     app.mount(
         "/ui",
         StaticFiles(directory=STATIC_DIR, html=True),
@@ -85,4 +85,20 @@ class SummaryRow(BaseModel):
 class SummaryResponse(BaseModel):
     income_total: Decimal
     expense_total: Decimal
-    rows: list[SummaryRow]
\ No newline at end of file
+    rows: list[SummaryRow]
+
+class CompiledCacheStats(BaseModel):
+    hits: int
+    misses: int
+    uncached: int
+    hit_rate: float
+    size: int
+    capacity: int
+
+
+class StatsResponse(BaseModel):
+    startup_seconds: Optional[float] = None
+    import_seconds: Optional[float] = None
+    schema_seconds: Optional[float] = None
+    schema_created: Optional[bool] = None
+    compiled_cache: CompiledCacheStats
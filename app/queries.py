@@ -0,0 +1,40 @@
+from sqlalchemy import bindparam, func, select
+from .entities import Category, Transaction, User
+
+# Горячие запросы собираются один раз при импорте, значения передаются через
+# bind-параметры: ключ кэша SQLAlchemy совпадает между запросами, и
+# скомпилированный SQL берется из compiled cache движка.
+
+USER_BY_LOGIN = select(User).where(User.login == bindparam("login"))
+
+CATEGORY_FOR_OWNER = select(Category).where(
+    Category.id == bindparam("category_id"),
+    Category.owner_id == bindparam("user_id"),
+)
+
+CATEGORIES_FOR_OWNER = select(Category).where(
+    Category.owner_id == bindparam("user_id")
+)
+
+TRANSACTION_FOR_OWNER = select(Transaction).where(
+    Transaction.id == bindparam("tx_id"),
+    Transaction.owner_id == bindparam("user_id"),
+)
+
+TRANSACTIONS_FOR_OWNER = (
+    select(Transaction)
+    .where(Transaction.owner_id == bindparam("user_id"))
+    .order_by(Transaction.occurred_at.desc())
+)
+
+SUMMARY_FOR_OWNER = (
+    select(
+        Category.id,
+        Category.name,
+        Category.kind,
+        func.coalesce(func.sum(Transaction.amount), 0),
+    )
+    .join(Transaction, Transaction.category_id == Category.id, isouter=True)
+    .where(Category.owner_id == bindparam("user_id"))
+    .group_by(Category.id)
+)
@@ -1,5 +1,4 @@
-from . import auth_routes, categories_routes, transactions_routes
-
-__all__ = ["auth_routes", "categories_routes", "transactions_routes"]
+from . import auth_routes, categories_routes, stats_routes, transactions_routes
 
+__all__ = ["auth_routes", "categories_routes", "stats_routes", "transactions_routes"]
 
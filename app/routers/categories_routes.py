@@ -1,9 +1,8 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.routing import APIRouter
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import auth, models
+from .. import auth, models, queries
 from ..db import get_session
 from ..entities import Category
 
@@ -43,8 +42,9 @@ async def list_categories(
     session: AsyncSession = Depends(get_session),
     current_user: models.User = Depends(auth.get_current_user),
 ) -> list[models.Category]:
-    stmt = select(Category).where(Category.owner_id == current_user.id)
-    result = await session.execute(stmt)
+    result = await session.execute(
+        queries.CATEGORIES_FOR_OWNER, {"user_id": current_user.id}
+    )
     categories = result.scalars().all()
     return [models.Category.model_validate(cat) for cat in categories]
 
@@ -52,10 +52,9 @@ async def list_categories(
 async def _get_category_or_404(
     session: AsyncSession, category_id: int, user_id: int
 ) -> Category:
-    stmt = select(Category).where(
-        Category.id == category_id, Category.owner_id == user_id
+    result = await session.execute(
+        queries.CATEGORY_FOR_OWNER, {"category_id": category_id, "user_id": user_id}
     )
-    result = await session.execute(stmt)
     category = result.scalar_one_or_none()
     if category is None:
         raise HTTPException(
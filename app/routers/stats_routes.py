@@ -0,0 +1,29 @@
+from fastapi import Depends, Request
+from fastapi.routing import APIRouter
+
+from .. import auth, models
+from ..db import get_cache_stats
+
+router = APIRouter(tags=["stats"])
+
+
+@router.get(
+    "/stats",
+    response_model=models.StatsResponse,
+    summary="Статистика сервиса",
+    description="Время старта воркера и попадания в кэш скомпилированных SQL-запросов.",
+)
+async def read_stats(
+    request: Request,
+    current_user: models.User = Depends(auth.get_current_user),
+) -> models.StatsResponse:
+    state = request.app.state
+    return models.StatsResponse(
+        startup_seconds=getattr(state, "startup_seconds", None),
+        import_seconds=getattr(state, "import_seconds", None),
+        schema_seconds=getattr(state, "schema_seconds", None),
+        schema_created=getattr(state, "schema_created", None),
+        compiled_cache=models.CompiledCacheStats(**get_cache_stats()),
+    )
+
+
@@ -1,9 +1,8 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.routing import APIRouter
-from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .. import auth, models
+from .. import auth, models, queries
 from ..db import get_session
 from ..entities import Category, Transaction
 
@@ -13,10 +12,9 @@ router = APIRouter(tags=["transactions"])
 async def _get_transaction_or_404(
     session: AsyncSession, tx_id: int, user_id: int
 ) -> Transaction:
-    stmt = select(Transaction).where(
-        Transaction.id == tx_id, Transaction.owner_id == user_id
+    result = await session.execute(
+        queries.TRANSACTION_FOR_OWNER, {"tx_id": tx_id, "user_id": user_id}
     )
-    result = await session.execute(stmt)
     transaction = result.scalar_one_or_none()
     if transaction is None:
         raise HTTPException(
@@ -29,10 +27,9 @@ async def _get_transaction_or_404(
 async def _ensure_category_for_user(
     session: AsyncSession, category_id: int, user_id: int
 ) -> Category:
-    stmt = select(Category).where(
-        Category.id == category_id, Category.owner_id == user_id
+    result = await session.execute(
+        queries.CATEGORY_FOR_OWNER, {"category_id": category_id, "user_id": user_id}
     )
-    result = await session.execute(stmt)
     category = result.scalar_one_or_none()
     if category is None:
         raise HTTPException(
@@ -78,12 +75,9 @@ async def list_transactions(
     session: AsyncSession = Depends(get_session),
     current_user: models.User = Depends(auth.get_current_user),
 ) -> list[models.Transaction]:
-    stmt = (
-        select(Transaction)
-        .where(Transaction.owner_id == current_user.id)
-        .order_by(Transaction.occurred_at.desc())
+    result = await session.execute(
+        queries.TRANSACTIONS_FOR_OWNER, {"user_id": current_user.id}
     )
-    result = await session.execute(stmt)
     txs = result.scalars().all()
     return [models.Transaction.model_validate(tx) for tx in txs]
 
@@ -97,18 +91,9 @@ async def transaction_summary(
     session: AsyncSession = Depends(get_session),
     current_user: models.User = Depends(auth.get_current_user),
 ) -> models.SummaryResponse:
-    stmt = (
-        select(
-            Category.id,
-            Category.name,
-            Category.kind,
-            func.coalesce(func.sum(Transaction.amount), 0),
-        )
-        .join(Transaction, Transaction.category_id == Category.id, isouter=True)
-        .where(Category.owner_id == current_user.id)
-        .group_by(Category.id)
+    result = await session.execute(
+        queries.SUMMARY_FOR_OWNER, {"user_id": current_user.id}
     )
-    result = await session.execute(stmt)
     rows = []
     income_total = 0
     expense_total = 0
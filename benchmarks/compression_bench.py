@@ -0,0 +1,50 @@
+"""Байты на проводе и CPU на сжатие ответа: python -m benchmarks.compression_bench
+
+Тело ответа имитирует GET /transactions разного размера.
+"""
+import json
+import time
+from app.compression import make_stream
+
+SIZES = (1, 10, 100, 1000, 10000)
+ITERATIONS = 50
+
+
+def _payload(count: int) -> bytes:
+    rows = [
+        {
+            "amount": f"{(i * 37) % 5000 + 0.5:.2f}",
+            "description": f"Покупка #{i}",
+            "occurred_at": f"2026-01-{i % 28 + 1:02d}T12:00:00Z",
+            "category_id": i % 12 + 1,
+            "id": i + 1,
+            "owner_id": 1,
+        }
+        for i in range(count)
+    ]
+    return json.dumps(rows, ensure_ascii=False).encode("utf-8")
+
+
+def _measure(body: bytes, encoding: str) -> tuple[int, float]:
+    started = time.process_time()
+    for _ in range(ITERATIONS):
+        stream = make_stream(encoding)
+        compressed = stream.compress(body) + stream.finish()
+    cpu_ms = (time.process_time() - started) / ITERATIONS * 1000
+    return len(compressed), cpu_ms
+
+
+def main() -> None:
+    print(f"{'rows':>6} {'raw, B':>10} {'gzip, B':>10} {'gzip, ms':>9} {'br, B':>10} {'br, ms':>9}")
+    for count in SIZES:
+        body = _payload(count)
+        gzip_size, gzip_ms = _measure(body, "gzip")
+        br_size, br_ms = _measure(body, "br")
+        print(
+            f"{count:>6} {len(body):>10} {gzip_size:>10} {gzip_ms:>9.3f} "
+            f"{br_size:>10} {br_ms:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
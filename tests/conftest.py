@@ -0,0 +1,41 @@
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+# Движок создается при импорте app.db, поэтому база подменяется до импорта приложения.
+_DB_DIR = tempfile.mkdtemp(prefix="finance-tests-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_DB_DIR}/test.db"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.db import Base, engine  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+async def _drop_schema() -> None:
+    await engine.dispose()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest.fixture
+def empty_db():
+    asyncio.run(_drop_schema())
+
+
+@pytest.fixture
+def client(empty_db):
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def auth_headers(client):
+    client.post("/auth/register", json={"login": "tester", "password": "secret1"})
+    response = client.post(
+        "/auth/token", data={"username": "tester", "password": "secret1"}
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
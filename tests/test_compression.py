@@ -0,0 +1,244 @@
+import asyncio
+import gzip
+import zlib
+
+import brotli
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.build_static import build
+from app.compression import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    CompressionMiddleware,
+    PrecompressedStaticFiles,
+    accepted_encodings,
+)
+
+BIG_TEXT = "строка для сжатия " * 200
+CHUNKS = [f"chunk-{i} " * 100 for i in range(5)]
+
+
+def _decompress(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.decompress(data)
+    return gzip.decompress(data)
+
+
+def _make_app() -> FastAPI:
+    api = FastAPI()
+    api.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @api.get("/big")
+    def big():
+        return JSONResponse({"text": BIG_TEXT}, headers={"ETag": '"abc"'})
+
+    @api.get("/small")
+    def small():
+        return {"ok": True}
+
+    @api.get("/stream")
+    def stream():
+        return StreamingResponse(iter(CHUNKS), media_type="text/plain")
+
+    @api.get("/archive")
+    def archive():
+        return Response(b"\x1f\x8b" + b"0" * 5000, media_type="application/gzip")
+
+    @api.get("/status/{code}")
+    def with_status(code: int):
+        if code == 204:
+            return Response(status_code=204)
+        return Response(BIG_TEXT, status_code=code, media_type="text/plain")
+
+    return api
+
+
+@pytest.fixture
+def compress_client():
+    return TestClient(_make_app())
+
+
+def _raw_get(client: TestClient, path: str, accept_encoding: str, method: str = "GET"):
+    with client.stream(method, path, headers={"Accept-Encoding": accept_encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("br, gzip", ["br", "gzip"]),
+        ("gzip;q=1, br;q=0.5", ["gzip", "br"]),
+        ("gzip; q = 0.9, br;q=0.5", ["gzip", "br"]),
+        ("br;level=3;q=0", []),
+        ("br;q=5, gzip;q=0.8", ["br", "gzip"]),
+        ("*;q=0.5, gzip;q=0", ["br"]),
+        ("gzip;q=abc, br", ["br"]),
+        ("identity", []),
+        ("", []),
+    ],
+)
+def test_accepted_encodings(header, expected):
+    assert accepted_encodings(header) == expected
+
+
+@pytest.mark.parametrize("encoding", ["br", "gzip"])
+def test_large_response_compressed(compress_client, encoding):
+    response, raw = _raw_get(compress_client, "/big", encoding)
+    assert response.headers["content-encoding"] == encoding
+    assert response.headers["content-length"] == str(len(raw))
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == 'W/"abc"'
+    assert BIG_TEXT in _decompress(raw, encoding).decode("utf-8")
+
+
+def test_small_response_not_compressed(compress_client):
+    response, raw = _raw_get(compress_client, "/small", "br, gzip")
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert raw == b'{"ok":true}'
+
+
+def test_identity_when_nothing_accepted(compress_client):
+    response, raw = _raw_get(compress_client, "/big", "identity")
+    assert "content-encoding" not in response.headers
+    assert BIG_TEXT in raw.decode("utf-8")
+
+
+def test_binary_content_type_not_compressed(compress_client):
+    response, raw = _raw_get(compress_client, "/archive", "br, gzip")
+    assert "content-encoding" not in response.headers
+    assert len(raw) == 5002
+
+
+@pytest.mark.parametrize("code", [204, 206, 304])
+def test_status_passthrough(compress_client, code):
+    response, _ = _raw_get(compress_client, f"/status/{code}", "br, gzip")
+    assert response.status_code == code
+    assert "content-encoding" not in response.headers
+
+
+def test_head_matches_identity(compress_client):
+    response, raw = _raw_get(compress_client, "/big", "br, gzip", method="HEAD")
+    assert raw == b""
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+
+
+@pytest.mark.parametrize("encoding", ["br", "gzip"])
+def test_streaming_response_round_trip(compress_client, encoding):
+    response, raw = _raw_get(compress_client, "/stream", encoding)
+    assert response.headers["content-encoding"] == encoding
+    assert "content-length" not in response.headers
+    assert _decompress(raw, encoding) == "".join(CHUNKS).encode("utf-8")
+
+
+@pytest.mark.parametrize("encoding", ["br", "gzip"])
+def test_streaming_chunks_flushed_immediately(encoding):
+    async def app(scope, receive, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"text/plain")],
+            }
+        )
+        for chunk in CHUNKS:
+            await send({"type": "http.response.body", "body": chunk.encode(), "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "headers": [(b"accept-encoding", encoding.encode())],
+    }
+    asyncio.run(CompressionMiddleware(app)(scope, receive, send))
+
+    bodies = [message["body"] for message in sent[1:]]
+    assert len(bodies) == len(CHUNKS) + 1
+    if encoding == "br":
+        decoder = brotli.Decompressor()
+        decode = decoder.process
+    else:
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        decode = decoder.decompress
+    # Каждый чанк декодируется сразу, без ожидания конца потока.
+    for chunk, body in zip(CHUNKS, bodies):
+        assert decode(body) == chunk.encode()
+
+
+@pytest.fixture
+def static_client(tmp_path):
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "index.html").write_text(
+        "<html><head><style>body { color: red; }"
+        + " .x { margin: 0; }" * 50
+        + "</style></head><body>"
+        + "<p>Учет личных доходов и расходов</p>" * 20
+        + "<script>const a = 1;"
+        + " console.log(a);" * 50
+        + "</script></body></html>",
+        encoding="utf-8",
+    )
+    dist = tmp_path / "dist"
+    build(source, dist)
+    api = FastAPI()
+    api.add_middleware(CompressionMiddleware, minimum_size=1024)
+    api.mount("/ui", PrecompressedStaticFiles(directory=dist, html=True), name="ui")
+    return TestClient(api), dist
+
+
+def test_build_extracts_hashed_assets(static_client):
+    _, dist = static_client
+    html = (dist / "index.html").read_text(encoding="utf-8")
+    assert "<style>" not in html and "<script>" not in html
+    assets = sorted(path.name for path in (dist / "assets").iterdir())
+    assert any(name.endswith(".css.br") for name in assets)
+    assert any(name.endswith(".js.gz") for name in assets)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [("br, gzip", "br"), ("gzip;q=1, br;q=0.5", "gzip"), ("gzip", "gzip"), ("identity", None)],
+)
+def test_static_variant_selection(static_client, accept_encoding, expected):
+    client, dist = static_client
+    response, raw = _raw_get(client, "/ui/", accept_encoding)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/html; charset=utf-8"
+    assert response.headers.get("content-encoding") == expected
+    assert response.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+    assert response.headers["vary"] == "Accept-Encoding"
+    body = _decompress(raw, expected) if expected else raw
+    assert body == (dist / "index.html").read_bytes()
+
+
+def test_static_index_revalidates(static_client):
+    client, _ = static_client
+    response, _ = _raw_get(client, "/ui/", "br")
+    revalidated = client.get(
+        "/ui/", headers={"Accept-Encoding": "br", "If-None-Match": response.headers["etag"]}
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+
+
+def test_static_assets_immutable(static_client):
+    client, dist = static_client
+    css = next((dist / "assets").glob("*.css")).name
+    for accept_encoding in ("br", "identity"):
+        response, _ = _raw_get(client, f"/ui/assets/{css}", accept_encoding)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/css")
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
@@ -0,0 +1,33 @@
+from fastapi.testclient import TestClient
+
+from app import db
+from app.main import app
+
+
+def test_schema_created_only_when_version_changes(empty_db, monkeypatch):
+    with TestClient(app):
+        assert app.state.schema_created is True
+    with TestClient(app):
+        assert app.state.schema_created is False
+    monkeypatch.setattr(db, "SCHEMA_VERSION", db.SCHEMA_VERSION + 1)
+    with TestClient(app):
+        assert app.state.schema_created is True
+
+
+def test_stats_requires_auth(client):
+    assert client.get("/stats").status_code == 401
+
+
+def test_stats_reports_startup_and_cache_hits(client, auth_headers):
+    for _ in range(3):
+        client.get("/categories", headers=auth_headers)
+    response = client.get("/stats", headers=auth_headers)
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["import_seconds"] > 0
+    assert stats["schema_seconds"] >= 0
+    assert stats["startup_seconds"] >= stats["import_seconds"]
+    cache = stats["compiled_cache"]
+    assert cache["hits"] > 0
+    assert 0 < cache["hit_rate"] <= 1
+    assert cache["size"] <= cache["capacity"]